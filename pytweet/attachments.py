@@ -5,6 +5,8 @@ import io
 import os
 from typing import Any, Dict, List, NoReturn, Optional, Union, TYPE_CHECKING
 
+import msgspec
+
 from .dataclass import PollOption, Option, Button
 from .entities import Media
 from .enums import ButtonType
@@ -675,7 +677,7 @@ class CustomProfile(Comparable):
         self._name = name
         self._id = id
         self._timestamp = timestamp
-        self._media = Media(media)
+        self._media = msgspec.convert(media, Media, strict=False)
         super().__init__(self.id)
 
     def __repr__(self) -> str:
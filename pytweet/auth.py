@@ -251,6 +251,8 @@ class OauthSession:
         self.oauth1_session = OAuth1Session(
             self.consumer_key, client_secret=self.consumer_secret, callback_uri=self.callback_url
         )
+        self._oauth1 = None
+        self._oauth1_credentials = None
         self.oauth_url = "https://api.twitter.com/oauth"
 
     @property
@@ -259,14 +261,25 @@ class OauthSession:
 
         .. versionadded:: 1.2.0
         """
-        return OAuth1(
+        # The credentials stay writable (e.g. the 3-legged flow sets the access token later), so rebuild on change.
+        credentials = (
             self.consumer_key,
-            client_secret=self.consumer_secret,
-            resource_owner_key=self.access_token,
-            resource_owner_secret=self.access_token_secret,
-            callback_uri=self.callback_url,
-            decoding=None,
+            self.consumer_secret,
+            self.access_token,
+            self.access_token_secret,
+            self.callback_url,
         )
+        if self._oauth1 is None or credentials != self._oauth1_credentials:
+            self._oauth1 = OAuth1(
+                self.consumer_key,
+                client_secret=self.consumer_secret,
+                resource_owner_key=self.access_token,
+                resource_owner_secret=self.access_token_secret,
+                callback_uri=self.callback_url,
+                decoding=None,
+            )
+            self._oauth1_credentials = credentials
+        return self._oauth1
 
     @property
     def basic_auth(self) -> str:
@@ -3,7 +3,6 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import json
 import logging
 import time
 import threading
@@ -12,6 +11,8 @@ from urllib.parse import urlparse
 from asyncio import iscoroutinefunction
 from http import HTTPStatus
 from typing import Callable, List, Optional, Union, Any
+
+import msgspec
 from flask import Flask, request
 
 from .attachments import CTA, CustomProfile, File, Geo, Poll, QuickReply
@@ -32,6 +33,7 @@ from .type import ID
 __all__ = ("Client",)
 
 _log = logging.getLogger(__name__)
+_JSON_DECODER = msgspec.json.Decoder()
 
 
 class Client:
@@ -61,6 +63,8 @@ class Client:
         Indicates to only use bearer token for all methods. This mean the client is now a twitter-api-client v2 interface. Some methods are unavailable to use such as fetching trends and location, environment fetching methods, and features such as events. Some methods can be recover with OAuth 2 authorization code flow with PKCE with the correct scopes or permissions. Like users.read scope for reading users info which some methods provide a way like :meth:`Client.fetch_user`.
     sleep_after_ratelimit: :class:`bool`
         Indicates to sleep when your client is ratelimited, If set to True it won't raise :class:`TooManyRequests` error but it would print a message indicating to sleep, then it sleeps for how many seconds it needs to sleep, after that it continue to restart the request.
+    max_user_cache: Optional[:class:`int`]
+        The maximum number of users kept in the client's internal user cache. Once the limit is reached, the least recently used user is dropped. Must be at least 1, a lower value raises :class:`ValueError`. Default to None, which keeps every user.
     verify_credentials: :class:`bool`
         Indicates to verify the credentials you specified, this includes consumer_key, consumer_secret, access_token, access_token_secret. make sure to specified all of them in your client, you cannot specified only one of them.
 
@@ -91,6 +95,7 @@ class Client:
         client_secret: Optional[str] = None,
         use_bearer_only: bool = False,
         sleep_after_ratelimit: bool = False,
+        max_user_cache: Optional[int] = None,
         verify_credentials: bool = False,
     ) -> None:
         self.http = HTTPClient(
@@ -105,6 +110,7 @@ class Client:
             client_secret=client_secret,
             use_bearer_only=use_bearer_only,
             sleep_after_ratelimit=sleep_after_ratelimit,
+            max_user_cache=max_user_cache,
         )
         self._account_user: Optional[User] = None  # set in account property.
         self.webhook: Optional[Webhook] = None
@@ -143,8 +149,11 @@ class Client:
         if not self.http.access_token:
             return None
 
-        data = self.http.fetch_me()._User__original_payload
-        self._account_user = ClientAccount(data, http_client=self.http)
+        me = self.http.fetch_me()
+        if me is None:
+            return None
+
+        self._account_user = ClientAccount({"data": me._payload, "includes": me._includes}, http_client=self.http)
 
     def event(self, func: Callable) -> None:
         """A decorator for making an event, the event will be register in the client's internal cache.
@@ -289,7 +298,7 @@ class Client:
         """
         return self.http.fetch_welcome_message_rule(welcome_message_rule_id)
 
-    def fetch_space(self, space_id: ID) -> Space:
+    def fetch_space(self, space_id: ID) -> Optional[Space]:
         """Fetches a space.
 
         Parameters
@@ -299,8 +308,8 @@ class Client:
 
         Returns
         ---------
-        :class:`Space`
-            This method returns a :class:`Space` object.
+        Optional[:class:`Space`]
+            This method returns a :class:`Space` object, or None if the response has no space.
 
 
         .. versionadded:: 1.3.5
@@ -580,10 +589,7 @@ class Client:
         .. versionadded:: 1.5.0
         """
         res = self.http.request("GET", "1.1", "/trends/available.json", auth=True)
-        for index, data in enumerate(res):
-            res[index] = self.http.payload_parser.parse_trend_location_payload(data)
-
-        return [Location(**data) for data in res]
+        return [Location.from_payload(data) for data in res]
 
     def search_trend_closest(self, lat: int, long: int) -> Optional[List[Location]]:
         """Search the rend closest to the lat and long.
@@ -611,7 +617,7 @@ class Client:
             auth=True,
         )
 
-        return [Location(**data) for data in res]
+        return [Location.from_payload(data) for data in res]
 
     def search_recent_tweet(
         self,
@@ -979,9 +985,14 @@ class Client:
 
                     response = {"response_token": "sha256=" + format(str(digested)[2:-1])}
 
-                    return json.dumps(response)
+                    return msgspec.json.encode(response)
+
+                try:
+                    json_data = _JSON_DECODER.decode(request.get_data())
+                except msgspec.DecodeError:
+                    _log.warning("Received a webhook event with an invalid JSON body, ignoring it.")
+                    return ("", HTTPStatus.BAD_REQUEST)
 
-                json_data = request.get_json()
                 _log.debug(f"An event triggered! {json_data}")
                 self.executor.submit(self.http.handle_events, payload=json_data)
                 return ("", HTTPStatus.OK)
@@ -13,6 +13,32 @@ POLL_FIELD = "duration_minutes,end_datetime,id,options,voting_status"
 TOPIC_FIELD = "id,name,description"
 LIST_FIELD = "created_at,follower_count,member_count,private,description,owner_id"
 
+# Shared request parameters. Pass a copy to anything that mutates them, such as a pagination.
+_USER_PARAMS = {
+    "expansions": PINNED_TWEET_EXPANSION,
+    "user.fields": USER_FIELD,
+    "tweet.fields": TWEET_FIELD,
+}
+_TWEET_PARAMS = {
+    "tweet.fields": TWEET_FIELD,
+    "user.fields": USER_FIELD,
+    "expansions": TWEET_EXPANSION,
+    "media.fields": MEDIA_FIELD,
+    "place.fields": PLACE_FIELD,
+    "poll.fields": POLL_FIELD,
+}
+_SPACE_PARAMS = {
+    "expansions": SPACE_EXPANSION,
+    "space.fields": SPACE_FIELD,
+    "topic.fields": TOPIC_FIELD,
+    "user.fields": USER_FIELD,
+}
+_LIST_PARAMS = {
+    "expansions": LIST_EXPANSION,
+    "list.fields": LIST_FIELD,
+    "user.fields": USER_FIELD,
+}
+
 # Indicator for the return_when argument in wait_for_futures method.
 FIRST_COMPLETED = "FIRST_COMPLETED"
 FIRST_EXCEPTION = "FIRST_EXCEPTION"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 @dataclass
@@ -19,6 +19,23 @@ class Location:
     url: str
     woeid: int
 
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> Location:
+        """Builds a :class:`Location` from a raw trend location payload.
+
+        .. versionadded:: 1.5.0
+        """
+        place_type = payload.get("placeType")
+        return cls(
+            country=payload.get("country"),
+            country_code=payload.get("countryCode"),
+            name=payload.get("name"),
+            parent_id=payload.get("parentid"),
+            place_type=PlaceType(**place_type) if place_type else None,
+            url=payload.get("url"),
+            woeid=payload.get("woeid"),
+        )
+
 
 @dataclass
 class Trend:
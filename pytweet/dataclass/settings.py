@@ -1,5 +1,7 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 from .locations import Location, TimezoneInfo
 
 
@@ -39,3 +41,43 @@ class UserSettings:
     show_all_inline_media: Optional[bool] = None
     location: Optional[Location] = None
     timezone: Optional[TimezoneInfo] = None
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> UserSettings:
+        """Builds a :class:`UserSettings` from a raw ``account/settings.json`` response.
+
+        .. versionadded:: 1.5.0
+        """
+        sleep_time = payload.get("sleep_time")
+        time_zone = payload.get("time_zone")
+        trend_locations = payload.get("trend_location")
+
+        location = Location.from_payload(trend_locations[0]) if trend_locations else None
+
+        timezone = None
+        if time_zone:
+            timezone = TimezoneInfo(
+                name=time_zone.get("name"),
+                name_info=time_zone.get("tzinfo_name"),
+                utc_offset=time_zone.get("utc_offset"),
+            )
+
+        return cls(
+            always_use_https=payload.get("always_use_https"),
+            geo_enabled=payload.get("geo_enabled"),
+            sleep_time_setting=SleepTimeSettings(**sleep_time) if sleep_time else None,
+            use_cookie_personalization=payload.get("use_cookie_personalization"),
+            language=payload.get("language"),
+            discoverable_by_email=payload.get("discoverable_by_email"),
+            discoverable_by_mobile_phone=payload.get("discoverable_by_mobile_phone"),
+            display_sensitive_media=payload.get("display_sensitive_media"),
+            allow_contributor_request=payload.get("allow_contributor_request"),
+            allow_dms_from=payload.get("allow_dms_from"),
+            allow_dm_groups_from=payload.get("allow_dm_groups_from"),
+            protected=payload.get("protected"),
+            translator_type=payload.get("translator_type"),
+            screen_name=payload.get("screen_name"),
+            show_all_inline_media=payload.get("show_all_inline_media"),
+            location=location,
+            timezone=timezone,
+        )
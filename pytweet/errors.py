@@ -1,6 +1,8 @@
+import msgspec
 import requests
 from typing import Optional
-from json import decoder
+
+_JSON_DECODER = msgspec.json.Decoder()
 
 
 class PytweetException(Exception):
@@ -48,23 +50,29 @@ class HTTPException(PytweetException):
         self.message = message
         self.detail = None
         if response is not None:
-            try:
-                res = self.response.json()
-                if res.get("errors"):
-                    self.message = res.get("errors")[0].get("message") if not message else message
-                    self.detail = res.get("errors")[0].get("detail")
+            res = None
+            if response.content:
+                try:
+                    res = _JSON_DECODER.decode(response.content)
+                except msgspec.DecodeError:
+                    pass
+
+            if res is None:
+                super().__init__(
+                    f"Request returned an Exception (status code: {self.response.status_code}): {self.response.text}",
+                )
+
+            else:
+                errors = res.get("errors")
+                if errors:
+                    self.message = errors[0].get("message") if not message else message
+                    self.detail = errors[0].get("detail")
 
                 else:
                     self.message = res.get("error")
                     if not self.message:
                         self.detail = res.get("detail")
 
-            except decoder.JSONDecodeError:
-                super().__init__(
-                    f"Request returned an Exception (status code: {self.response.status_code}): {self.response.text}",
-                )
-
-            else:
                 super().__init__(
                     f"Request returned an Exception (status code: {self.response.status_code}): {self.message if self.message else self.detail}",
                 )
@@ -158,8 +166,9 @@ class NotFoundError(APIException):
         response: Optional[requests.models.Response] = None,
         message: Optional[str] = None,
     ):
-        msg = response.json().get("errors")[0].get("message") if not message else message
-        detail = response.json().get("errors")[0].get("detail")
+        error = _JSON_DECODER.decode(response.content).get("errors")[0]
+        msg = error.get("message") if not message else message
+        detail = error.get("detail")
         super().__init__(response, msg if msg else detail if detail else "Not Found!")
 
 
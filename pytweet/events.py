@@ -18,7 +18,7 @@ class Event:
     __slots__ = ("_payload", "_type")
 
     def __init__(self, data: Payload):
-        self._type = list(data.keys())[1]
+        self._type = list(data)[1]
         self._payload = data.get(self._type)[0]
 
     @property
@@ -4,11 +4,12 @@ import io
 import logging
 import sys
 import time
+import msgspec
 import requests
 import random
 import string
-from json import JSONDecodeError
-from typing import Any, List, NoReturn, Optional, Union, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Any, Dict, List, NoReturn, Optional, Union, TYPE_CHECKING
 
 from .attachments import CTA, CustomProfile, File, Geo, Poll, QuickReply
 from .auth import OauthSession
@@ -25,18 +26,13 @@ from .errors import (
     FieldsTooLarge,
 )
 from .constants import (
-    TWEET_EXPANSION,
     SPACE_EXPANSION,
-    LIST_EXPANSION,
-    PINNED_TWEET_EXPANSION,
-    MEDIA_FIELD,
-    PLACE_FIELD,
-    POLL_FIELD,
     SPACE_FIELD,
-    TWEET_FIELD,
-    USER_FIELD,
     TOPIC_FIELD,
-    LIST_FIELD,
+    _USER_PARAMS,
+    _TWEET_PARAMS,
+    _SPACE_PARAMS,
+    _LIST_PARAMS,
 )
 from .message import DirectMessage, Message, WelcomeMessage, WelcomeMessageRule
 from .parsers import EventParser
@@ -52,6 +48,63 @@ if TYPE_CHECKING:
     from .stream import Stream
 
 _log = logging.getLogger(__name__)
+_CODE_TO_EXCEPTION = {
+    400: BadRequests,
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound,
+    409: Conflict,
+    431: FieldsTooLarge,
+}
+
+
+class _LRUCache(OrderedDict):
+    """A dict that drops its least recently used entries once it holds more than ``maxsize`` items."""
+
+    def __init__(self, maxsize: Optional[int] = None):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("max_user_cache must be a positive integer or None!")
+
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if self.maxsize is None or key not in self:
+            return super().get(key, default)
+
+        self.move_to_end(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        if self.maxsize is None:
+            return
+
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class _DataResponse(msgspec.Struct):
+    """The ``data``/``includes`` envelope returned by the v2 lookup endpoints."""
+
+    data: Optional[Dict[str, Any]] = None
+    includes: Optional[Dict[str, Any]] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+    def to_payload(self) -> Payload:
+        return {"data": self.data, "includes": self.includes}
+
+
+class _EventResponse(msgspec.Struct):
+    """The ``event`` envelope returned by the v1.1 direct message endpoints."""
+
+    event: Optional[Dict[str, Any]] = None
+
+
+_JSON_DECODER = msgspec.json.Decoder()
+_DATA_DECODER = msgspec.json.Decoder(_DataResponse)
+_EVENT_DECODER = msgspec.json.Decoder(_EventResponse)
 
 
 class HTTPClient:
@@ -69,6 +122,7 @@ class HTTPClient:
         client_secret: Optional[str] = None,
         use_bearer_only: bool = False,
         sleep_after_ratelimit: bool = False,
+        max_user_cache: Optional[int] = None,
     ) -> Union[None, NoReturn]:
         self.credentials = {
             "bearer_token": bearer_token,
@@ -96,10 +150,17 @@ class HTTPClient:
         self.base_url = "https://api.twitter.com/"
         self.upload_url = "https://upload.twitter.com/"
         self.bearer_token = bearer_token
+        self._default_headers = {
+            "Authorization": f"Bearer {self.bearer_token}",
+            "User-Agent": "Py-Tweet (https://github.com/PyTweet/PyTweet/) Python/{0[0]}.{0[1]}.{0[2]} requests/{1}".format(
+                sys.version_info, requests.__version__
+            ),
+        }
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
         self.access_token = access_token
         self.access_token_secret = access_token_secret
+        self._my_id = None
         self.stream = stream
         self.callback_url = callback_url
         self.client_id = client_id
@@ -123,7 +184,7 @@ class HTTPClient:
         self.client_id = client_id
         self.message_cache = {}
         self.tweet_cache = {}
-        self.user_cache = {}
+        self.user_cache = _LRUCache(max_user_cache)
         self.events = {}
         if self.stream:
             self.stream.http_client = self
@@ -137,6 +198,12 @@ class HTTPClient:
     def oauth_session(self) -> OauthSession:
         return self._auth
 
+    @property
+    def my_id(self) -> str:
+        if self._my_id is None:
+            self._my_id = self.access_token.partition("-")[0]
+        return self._my_id
+
     def generate_thread_session(self):
         return "".join((random.sample(string.ascii_lowercase, 10)))
 
@@ -154,28 +221,25 @@ class HTTPClient:
         version: str,
         path: str,
         *,
-        headers: Payload = {},
-        params: Payload = {},
-        json: Payload = {},
-        data: Payload = {},
-        files: Payload = {},
+        headers: Optional[Payload] = None,
+        params: Optional[Union[Payload, str]] = None,
+        json: Optional[Payload] = None,
+        data: Optional[Payload] = None,
+        files: Optional[Payload] = None,
         auth: bool = False,
         basic_auth: bool = False,
         thread_name: Optional[str] = None,
         thread_session: bool = False,
         use_base_url: bool = True,
         is_json: bool = True,
+        decoder: Optional[msgspec.json.Decoder] = None,
     ) -> ResponsePayload:
         if use_base_url:
             url = self.base_url + version + path
         else:
             url = self.upload_url + version + path
 
-        user_agent = "Py-Tweet (https://github.com/PyTweet/PyTweet/) Python/{0[0]}.{0[1]}.{0[2]} requests/{1}"
-        if "Authorization" not in headers.keys():
-            headers["Authorization"] = f"Bearer {self.bearer_token}"
-
-        headers["User-Agent"] = user_agent.format(sys.version_info, requests.__version__)
+        headers = self._default_headers.copy() if headers is None else {**self._default_headers, **headers}
 
         if not self.use_bearer_only:
             if auth:
@@ -198,6 +262,7 @@ class HTTPClient:
             data = None
 
         method = method.upper()
+        decoder = decoder or _JSON_DECODER
         if thread_session:
             executor = self.thread_manager.create_new_executor(thread_name=thread_name, session_id=thread_session)
             future = executor.submit(
@@ -211,56 +276,43 @@ class HTTPClient:
                 json=json,
                 files=files,
                 auth=auth,
+                decoder=decoder,
             )
             return future
 
         else:
+            body = data
+            if json:
+                body = msgspec.json.encode(json)
+                headers = {**headers, "Content-Type": "application/json"}
+
             response = self.__session.request(
                 method,
                 url,
                 headers=headers,
                 params=params,
-                data=data,
-                json=json,
+                data=body,
                 files=files,
                 auth=auth,
             )
             code = response.status_code
             self.current_header = response.headers
-            res = None
-            _log.debug(
-                f"{method} {url} has returned: "
-                f"{response.status_code} {response.reason}\n"
-                f"Headers: {response.headers}\n"
-                f"Content: {response.content}\n"
-                f"Json-payload: {json}\n"
-                f"Parameters: {params}\n"
-            )
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug(
+                    f"{method} {url} has returned: "
+                    f"{code} {response.reason}\n"
+                    f"Headers: {response.headers}\n"
+                    f"Content: {response.content}\n"
+                    f"Json-payload: {json}\n"
+                    f"Parameters: {params}\n"
+                )
 
             if code in (201, 202, 204):
-                if is_json:
-                    try:
-                        res = response.json()
-                    except JSONDecodeError:
-                        return response.text
-                else:
-                    return response.text
-                return res
-
-            elif code == 400:
-                raise BadRequests(response)
+                return self._decode_response(response, decoder, is_json)
 
-            elif code == 401:
-                raise Unauthorized(response)
-
-            elif code == 403:
-                raise Forbidden(response)
-
-            elif code == 404:
-                raise NotFound(response)
-
-            elif code == 409:
-                raise Conflict(response)
+            exception = _CODE_TO_EXCEPTION.get(code)
+            if exception:
+                raise exception(response)
 
             elif code in (420, 429):
                 if self.sleep_after_ratelimit:
@@ -279,65 +331,50 @@ class HTTPClient:
                         json=json,
                         files=files,
                         auth=auth,
+                        decoder=decoder,
                     )
 
                 else:
                     raise TooManyRequests(response)
 
-            elif code == 431:
-                raise FieldsTooLarge(response)
+            res = self._decode_response(response, decoder, is_json)
+            if not isinstance(res, dict):
+                return res
 
-            if is_json:
-                try:
-                    res = response.json()
-                except JSONDecodeError:
-                    return response.text
-            else:
-                return response.text
+            meta = res.get("meta")
+            if meta and meta.get("result_count") == 0:
+                return []
+            return res
 
-            if isinstance(res, dict):
-                if "meta" in res.keys():
-                    try:
-                        if res["meta"]["result_count"] == 0:
-                            return []
-                    except KeyError:
-                        pass
+    @staticmethod
+    def _decode_response(
+        response: requests.models.Response, decoder: msgspec.json.Decoder, is_json: bool
+    ) -> ResponsePayload:
+        if not is_json:
+            return response.text
 
-            return res
+        if decoder is _JSON_DECODER:
+            if not response.content:
+                return response.text
+            try:
+                return decoder.decode(response.content)
+            except msgspec.DecodeError:
+                return response.text
+
+        # Typed decoders hand back an empty envelope rather than text, so callers can always check its fields.
+        if not response.content:
+            return decoder.type()
+        try:
+            return decoder.decode(response.content)
+        except msgspec.DecodeError as e:
+            raise PytweetException(
+                f"Request returned an undecodable payload (status code: {response.status_code}): {e}"
+            ) from e
 
     def upload(self, file: File, command: str):
         assert command.upper() in ("INIT", "APPEND", "FINALIZE", "STATUS")
         thread_session = self.generate_thread_session()
 
-        def check_status(processing_info, media_id):
-            if not processing_info:
-                return
-
-            state = processing_info["state"]
-            seconds = processing_info.get("check_after_secs")
-            if seconds is None:
-                return None
-
-            if state == "succeeded":
-                return
-
-            if state == "failed":
-                raise PytweetException(f"Failed to finalize Media!\n{processing_info}")
-
-            time.sleep(seconds)
-
-            res = self.request(
-                "GET",
-                version="1.1",
-                path="/media/upload.json",
-                params={"command": "STATUS", "media_id": media_id},
-                auth=True,
-                use_base_url=False,
-            )
-
-            processing_info = res.get("processing_info", None)
-            check_status(processing_info, media_id)
-
         if command.upper() == "INIT":
             data = {
                 "command": "INIT",
@@ -360,6 +397,9 @@ class HTTPClient:
             return res["media_id"]
 
         elif command.upper() == "APPEND":
+            if not file.media_id:
+                raise ValueError("'media_id' is None! Please specified it.")
+
             segment_id = 0
             bytes_sent = 0
             path = file.path
@@ -368,26 +408,34 @@ class HTTPClient:
             else:
                 open_file = open(path, "rb")
 
-            if not file.media_id:
-                raise ValueError("'media_id' is None! Please specified it.")
-
-            while bytes_sent < file.total_bytes:
-                self.request(
-                    "POST",
-                    version="1.1",
-                    path="/media/upload.json",
-                    data={
-                        "command": "APPEND",
-                        "media_id": file.media_id,
-                        "segment_index": segment_id,
-                    },
-                    files={"media": open_file.read(4 * 1024 * 1024)},
-                    auth=True,
-                    use_base_url=False,
-                )
+            # One buffer is reused for every segment, requests accepts the memoryview slice as the file content.
+            buffer = bytearray(4 * 1024 * 1024)
+            view = memoryview(buffer)
+            try:
+                while bytes_sent < file.total_bytes:
+                    size = open_file.readinto(buffer)
+                    if not size:
+                        break
+
+                    self.request(
+                        "POST",
+                        version="1.1",
+                        path="/media/upload.json",
+                        data={
+                            "command": "APPEND",
+                            "media_id": file.media_id,
+                            "segment_index": segment_id,
+                        },
+                        files={"media": view[:size]},
+                        auth=True,
+                        use_base_url=False,
+                    )
 
-                bytes_sent = open_file.tell()
-                segment_id += 1
+                    bytes_sent += size
+                    segment_id += 1
+            finally:
+                if open_file is not path:
+                    open_file.close()
 
         elif command.upper() == "FINALIZE":
             executor = self.thread_manager.create_new_executor(thread_name="subfiles-upload-request")
@@ -400,7 +448,27 @@ class HTTPClient:
                 use_base_url=False,
             )
 
-            check_status(res.get("processing_info", None), file.media_id)
+            processing_info = res.get("processing_info", None)
+            while processing_info:
+                state = processing_info["state"]
+                if state == "failed":
+                    raise PytweetException(f"Failed to finalize Media!\n{processing_info}")
+
+                seconds = processing_info.get("check_after_secs")
+                if seconds is None or state == "succeeded":
+                    break
+
+                time.sleep(seconds)
+                res = self.request(
+                    "GET",
+                    version="1.1",
+                    path="/media/upload.json",
+                    params={"command": "STATUS", "media_id": file.media_id},
+                    auth=True,
+                    use_base_url=False,
+                )
+                processing_info = res.get("processing_info", None)
+
             if file.alt_text:
                 alt_text_future = self.request(
                     "POST",
@@ -470,24 +538,23 @@ class HTTPClient:
         self.upload(file, "FINALIZE")
         return file
 
-    def fetch_me(self):
+    def fetch_me(self) -> Optional[User]:
         data = self.request(
             "GET",
             "2",
             f"/users/me",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=_USER_PARAMS,
             auth=True,
+            decoder=_DATA_DECODER,
         )
+        if data.data is None:
+            return None
 
-        return User(data, http_client=self)
+        return User(data.to_payload(), http_client=self)
 
     def fetch_user(self, user_id: ID) -> Optional[User]:
         try:
-            int(user_id)
+            user_id = int(user_id)
         except ValueError:
             raise ValueError("user_id must be an int, or a string of digits!")
 
@@ -496,15 +563,16 @@ class HTTPClient:
                 "GET",
                 "2",
                 f"/users/{user_id}",
-                params={
-                    "expansions": PINNED_TWEET_EXPANSION,
-                    "user.fields": USER_FIELD,
-                    "tweet.fields": TWEET_FIELD,
-                },
+                params=_USER_PARAMS,
                 auth=True,
+                decoder=_DATA_DECODER,
             )
+            if data.data is None:
+                return None
 
-            return User(data, http_client=self)
+            user = User(data.to_payload(), http_client=self)
+            self.user_cache[user_id] = user
+            return user
         except NotFoundError:
             return None
 
@@ -522,11 +590,7 @@ class HTTPClient:
             "GET",
             "2",
             f"/users?ids={','.join(str_ids)}",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=_USER_PARAMS,
             auth=True,
         )
 
@@ -537,21 +601,21 @@ class HTTPClient:
 
     def fetch_user_by_username(self, username: str) -> Optional[User]:
         if username.startswith("@"):
-            username = username.replace("@", "", 1)
+            username = username[1:]
 
         try:
             data = self.request(
                 "GET",
                 "2",
                 f"/users/by/username/{username}",
-                params={
-                    "expansions": PINNED_TWEET_EXPANSION,
-                    "user.fields": USER_FIELD,
-                    "tweet.fields": TWEET_FIELD,
-                },
+                params=_USER_PARAMS,
                 auth=True,
+                decoder=_DATA_DECODER,
             )
-            user = User(data, http_client=self)
+            if data.data is None:
+                return None
+
+            user = User(data.to_payload(), http_client=self)
             self.user_cache[user.id] = user
             return user
         except NotFoundError:
@@ -563,36 +627,31 @@ class HTTPClient:
                 "GET",
                 "2",
                 f"/tweets/{tweet_id}",
-                params={
-                    "tweet.fields": TWEET_FIELD,
-                    "user.fields": USER_FIELD,
-                    "expansions": TWEET_EXPANSION,
-                    "media.fields": MEDIA_FIELD,
-                    "place.fields": PLACE_FIELD,
-                    "poll.fields": POLL_FIELD,
-                },
+                params=_TWEET_PARAMS,
                 auth=True,
+                decoder=_DATA_DECODER,
             )
+            if res.data is None:
+                return None
 
-            tweet = Tweet(res, http_client=self)
+            tweet = Tweet(res.to_payload(), http_client=self)
             self.tweet_cache[tweet.id] = tweet
             return tweet
         except NotFoundError:
             return None
 
-    def fetch_space(self, space_id: str) -> Space:
+    def fetch_space(self, space_id: str) -> Optional[Space]:
         res = self.request(
             "GET",
             "2",
             f"/spaces/{str(space_id)}",
-            params={
-                "expansions": SPACE_EXPANSION,
-                "space.fields": SPACE_FIELD,
-                "topic.fields": TOPIC_FIELD,
-                "user.fields": USER_FIELD,
-            },
+            params=_SPACE_PARAMS,
+            decoder=_DATA_DECODER,
         )
-        return Space(res, http_client=self)
+        if res.data is None:
+            return None
+
+        return Space(res.to_payload(), http_client=self)
 
     def fetch_spaces_bytitle(self, title: str, state: SpaceState = SpaceState.live) -> Space:
         res = self.request(
@@ -615,11 +674,7 @@ class HTTPClient:
             "2",
             f"/lists/{id}",
             auth=True,
-            params={
-                "expansions": LIST_EXPANSION,
-                "list.fields": LIST_FIELD,
-                "user.fields": USER_FIELD,
-            },
+            params=_LIST_PARAMS,
         )
         return TwitterList(res, http_client=self)
 
@@ -660,9 +715,13 @@ class HTTPClient:
         except ValueError:
             raise ValueError("event_id must be an integer or a string of digits.")
 
-        res = self.request("GET", "1.1", f"/direct_messages/events/show.json?id={event_id}", auth=True)
+        res = self.request(
+            "GET", "1.1", f"/direct_messages/events/show.json?id={event_id}", auth=True, decoder=_EVENT_DECODER
+        )
+        if res.event is None:
+            return None
 
-        message_create = res.get("event").get("message_create")
+        message_create = res.event.get("message_create")
         recipient_id = int(message_create.get("target").get("recipient_id"))
         sender_id = int(message_create.get("sender_id"))
 
@@ -674,9 +733,9 @@ class HTTPClient:
         if not sender:
             sender = self.fetch_user(sender_id)
 
-        res["event"]["message_create"]["target"]["recipient"] = recipient
-        res["event"]["message_create"]["target"]["sender"] = sender
-        message = DirectMessage(res, http_client=self)
+        message_create["target"]["recipient"] = recipient
+        message_create["target"]["sender"] = sender
+        message = DirectMessage({"event": res.event}, http_client=self)
         self.message_cache[message.id] = message
         self.message_cache[recipient_id] = recipient
         self.message_cache[sender_id] = sender
@@ -802,14 +861,19 @@ class HTTPClient:
             "/direct_messages/events/new.json",
             json=data,
             auth=True,
+            decoder=_EVENT_DECODER,
         )
+        if res.event is None:
+            return None
 
-        message_create = res.get("event").get("message_create")
-        user_id = message_create.get("target").get("recipient_id")
-        user = self.fetch_user(user_id)
-        res["event"]["message_create"]["target"]["recipient"] = user
+        message_create = res.event.get("message_create")
+        user_id = int(message_create.get("target").get("recipient_id"))
+        user = self.user_cache.get(user_id)
+        if not user:
+            user = self.fetch_user(user_id)
+        message_create["target"]["recipient"] = user
 
-        msg = DirectMessage(res, http_client=self)
+        msg = DirectMessage({"event": res.event}, http_client=self)
         self.message_cache[msg.id] = msg
         return msg
 
@@ -868,22 +932,17 @@ class HTTPClient:
             )
 
         if reply_tweet:
-            payload["reply"] = {}
-            payload["reply"]["in_reply_to_tweet_id"] = (
-                reply_tweet.id if isinstance(reply_tweet, Tweet) else str(reply_tweet)
-            )
+            payload["reply"] = {
+                "in_reply_to_tweet_id": reply_tweet.id if isinstance(reply_tweet, Tweet) else str(reply_tweet)
+            }
 
         if quote_tweet:
             payload["quote_tweet_id"] = quote_tweet.id if isinstance(quote_tweet, Tweet) else str(quote_tweet)
 
         if exclude_reply_users:
-            ids = [str(user.id) if isinstance(user, User) else str(user) for user in exclude_reply_users]
-
-            if "reply" in payload.keys():
-                payload["reply"]["exclude_reply_user_ids"] = ids
-            else:
-                payload["reply"] = {}
-                payload["reply"]["exclude_reply_user_ids"] = ids
+            payload.setdefault("reply", {})["exclude_reply_user_ids"] = [
+                str(user.id) if isinstance(user, User) else str(user) for user in exclude_reply_users
+            ]
 
         if media_tagged_users:
             if not payload.get("media"):
@@ -902,8 +961,11 @@ class HTTPClient:
             for file in files:
                 payload["media"]["media_ids"].append(str(file.media_id))
 
-        res = self.request("POST", "2", "/tweets", json=payload, auth=True)
-        return self.fetch_tweet(res["data"]["id"])
+        res = self.request("POST", "2", "/tweets", json=payload, auth=True, decoder=_DATA_DECODER)
+        if res.data is None:
+            return None
+
+        return self.fetch_tweet(res.data["id"])
 
     def create_list(self, name: str, *, description: str = "", private: bool = False) -> Optional[TwitterList]:
         res = self.request(
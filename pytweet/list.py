@@ -126,7 +126,7 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         data = self.http_client.request(
             "POST", "2", f"/users/{my_id}/followed_lists", json={"list_id": str(self.id)}, auth=True
         )
@@ -143,7 +143,7 @@ class List(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         data = self.http_client.request("DELETE", "2", f"/users/{my_id}/followed_lists/{self.id}", auth=True)
         return RelationFollow(data)
 
@@ -172,7 +172,7 @@ class List(Comparable):
         )
 
         if not res:
-            return []
+            return UserPagination.empty()
 
         return UserPagination(
             res,
@@ -206,7 +206,7 @@ class List(Comparable):
         )
 
         if not res:
-            return []
+            return TweetPagination.empty()
 
         return TweetPagination(
             res,
@@ -354,7 +354,7 @@ class List(Comparable):
             auth=True,
         )
         if not res:
-            return []
+            return UserPagination.empty()
 
         return UserPagination(
             res,
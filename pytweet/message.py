@@ -3,6 +3,8 @@ from __future__ import annotations
 import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+import msgspec
+
 from .dataclass import ApplicationInfo
 from .attachments import CTA, File, QuickReply
 from .entities import Hashtag, Symbol, Url, UserMention
@@ -144,7 +146,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return [Hashtag(data) for data in self.__entities.get("hashtag")]
+        return msgspec.convert(self.__entities.get("hashtag"), List[Hashtag], strict=False)
 
     @property
     def symbols(self) -> Optional[List[Symbol]]:
@@ -152,7 +154,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return [Symbol(data) for data in self.__entities.get("symbols")]
+        return msgspec.convert(self.__entities.get("symbols"), List[Symbol], strict=False)
 
     @property
     def mentions(self) -> Optional[List[UserMention]]:
@@ -160,7 +162,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return [UserMention(data) for data in self.__entities.get("user_mentions")]
+        return msgspec.convert(self.__entities.get("user_mentions"), List[UserMention], strict=False)
 
     @property
     def urls(self) -> Optional[List[Url]]:
@@ -168,7 +170,7 @@ class DirectMessage(Message):
 
         .. versionadded:: 1.2.0
         """
-        return [Url(data) for data in self.__entities.get("urls")]
+        return msgspec.convert(self.__entities.get("urls"), List[Url], strict=False)
 
     @property
     def quick_reply(self) -> Optional[QuickReply]:
@@ -216,10 +218,7 @@ class DirectMessage(Message):
             auth=True,
         )
 
-        try:
-            self.http_client.message_cache.pop(int(self.id))
-        except KeyError:
-            pass
+        self.http_client.message_cache.pop(int(self.id), None)
 
     def mark_read(self) -> None:
         """Mark the DirectMessage as read, it also mark other messages before the DirectMessage was sent as read.
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 __all__ = (
     "UserPublicMetrics",
@@ -6,15 +6,19 @@ __all__ = (
 )
 
 
+def _to_int(value: Any) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
 class UserPublicMetrics:
-    __slots__ = ("__original_payload", "_public")
+    __slots__ = ("_username", "_public")
 
     def __init__(self, data: Dict[str, Any] = {}):
-        self.__original_payload = data
-        self._public = self.__original_payload.get("public_metrics")
+        self._username = data.get("username")
+        self._public = data.get("public_metrics")
 
     def __repr__(self) -> str:
-        return f"UserPublicMetrics(user={self.__original_payload.get('username')} follower_count={self.follower_count} following_count={self.following_count} tweet_count={self.tweet_count})"
+        return f"UserPublicMetrics(user={self._username} follower_count={self.follower_count} following_count={self.following_count} tweet_count={self.tweet_count})"
 
     @property
     def follower_count(self) -> int:
@@ -34,27 +38,30 @@ class UserPublicMetrics:
 
 
 class TweetPublicMetrics:
-    __slots__ = ("__original_payload", "_public")
+    __slots__ = ("_like_count", "_retweet_count", "_reply_count", "_quote_count")
 
     def __init__(self, data: Dict[str, Any] = {}) -> None:
-        self.__original_payload = data
-        self._public = self.__original_payload.get("public_metrics")
+        public = data.get("public_metrics") or {}
+        self._like_count = _to_int(public.get("like_count"))
+        self._retweet_count = _to_int(public.get("retweet_count"))
+        self._reply_count = _to_int(public.get("reply_count"))
+        self._quote_count = _to_int(public.get("quote_count"))
 
     def __repr__(self) -> str:
         return f"TweetPublicMetrics(like_count={self.like_count} retweet_count={self.retweet_count} reply_count={self.reply_count}> quote_count={self.quote_count})"
 
     @property
-    def like_count(self) -> int:
-        return int(self._public.get("like_count"))
+    def like_count(self) -> Optional[int]:
+        return self._like_count
 
     @property
-    def retweet_count(self) -> int:
-        return int(self._public.get("retweet_count"))
+    def retweet_count(self) -> Optional[int]:
+        return self._retweet_count
 
     @property
-    def reply_count(self) -> int:
-        return int(self._public.get("reply_count"))
+    def reply_count(self) -> Optional[int]:
+        return self._reply_count
 
     @property
-    def quote_count(self) -> int:
-        return int(self._public.get("quote_count"))
+    def quote_count(self) -> Optional[int]:
+        return self._quote_count
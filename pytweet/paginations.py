@@ -11,6 +11,15 @@ if TYPE_CHECKING:
 class Pagination:
     """Represents the base class of all pagination objects.
 
+    .. describe:: len(x)
+
+        Get the number of items in the current page.
+
+
+    .. describe:: iter(x)
+
+        Iterate over the objects in the current page.
+
 
     .. versionadded:: 1.5.0
     """
@@ -48,12 +57,27 @@ class Pagination:
         self._count = 0
         self._paginate_over = 0
         self._current_page_number = 1
+        # Owned by the pagination: page tokens are written into it in place, so callers pass a copy.
         self._params = kwargs.get("params", None)
         self.item_type = item_type
         self.endpoint_request = endpoint_request
         self.http_client = http_client
         self.pages_cache = {1: {obj.id: obj for obj in self.content}}
 
+    def __len__(self) -> int:
+        return len(self._payload) if self._payload else 0
+
+    def __iter__(self):
+        return iter(self.content)
+
+    @classmethod
+    def empty(cls) -> Pagination:
+        """Returns a new pagination without any pages. Fetch methods return this when the endpoint has no results.
+
+        .. versionadded:: 1.5.0
+        """
+        return cls({"data": [], "meta": {}}, endpoint_request=None, http_client=None)
+
     @property
     def original_payload(self):
         return self.__original_payload
@@ -109,7 +133,7 @@ class Pagination:
         .. versionadded:: 1.5.0
         """
         fulldata = []
-        for page_number in self.pages_cache.keys():
+        for page_number in self.pages_cache:
             fulldata.append(list(self.pages_cache.get(page_number).values()))
         return zip(range(1, len(self.pages_cache) + 1), fulldata)
 
@@ -256,6 +280,8 @@ class TweetPagination(Pagination):
 
         .. versionadded:: 1.5.0
         """
+        if not self.payload:
+            return []
 
         return [
             self.item_type(data, http_client=self.http_client)
@@ -358,6 +384,8 @@ class ListPagination(Pagination):
 
         .. versionadded:: 1.5.0
         """
+        if not self.payload:
+            return []
 
         return [
             self.item_type(data, http_client=self.http_client)
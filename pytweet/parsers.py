@@ -16,7 +16,6 @@ from .events import (
 from .message import Message, DirectMessage
 from .user import User
 from .tweet import Tweet
-from .dataclass import TimezoneInfo, Location, SleepTimeSettings
 from .dataclass import ApplicationInfo
 
 if TYPE_CHECKING:
@@ -41,12 +40,12 @@ class PayloadParser:
             "tweet_count": copy.get("statuses_count"),
             "listed_count": 0,
         }
-        if "created_timestamp" in copy.keys():
+        if "created_timestamp" in copy:
             copy["created_at"] = copy.get("created_timestamp")
-        if "screen_name" in copy.keys():
+        if "screen_name" in copy:
             copy["username"] = copy.get("screen_name")
 
-        if "profile_image_url_https" in copy.keys():
+        if "profile_image_url_https" in copy:
             copy["profile_image_url"] = copy.get("profile_image_url_https")
         return copy
 
@@ -61,35 +60,14 @@ class PayloadParser:
         copy["includes"] = {}
         copy["includes"]["mentions"] = [user.get("screen_name") for user in copy.get("entities").get("user_mentions")]
 
-        if "timestamp_ms" in payload.keys():
+        if "timestamp_ms" in payload:
             copy["timestamp"] = payload.get("timestamp_ms")
 
-        if "user" in payload.keys():
+        if "user" in payload:
             copy["includes"]["users"] = [self.parse_user_payload(payload.get("user"))]
 
         return copy
 
-    def parse_time_zone_payload(self, payload: Payload):
-        payload["name_info"] = payload.get("tzinfo_name")
-        payload["timezone"] = TimezoneInfo(**payload.get("time_zone"))
-        payload.pop("time_zone")
-        payload.pop("tzinfo_name")
-        return payload
-
-    def parse_trend_location_payload(self, payload: Payload):
-        payload["place_type"] = payload["placeType"]
-        payload["country_code"] = payload["countryCode"]
-        payload.pop("placeType")
-        payload.pop("countryCode")
-        payload.pop("parentid")
-        payload["location"] = Location(**payload)
-        return payload
-
-    def parse_sleep_time_payload(self, payload: Payload):
-        payload["sleep_time_setting"] = SleepTimeSettings(**payload["sleep_time"])
-        payload.pop("sleep_time")
-        return payload
-
     def insert_list_owner(self, payload: Payload, owner: User) -> Payload:
         payload["includes"] = {}
         payload["includes"]["users"] = [owner._payload]
@@ -105,7 +83,7 @@ class PayloadParser:
         return fulldata
 
     def parse_message_to_pagination_data(self, data: Payload, recipient: User, author: ClientAccount):
-        for event_data in data.get("events"):
+        for event_data in data.get("events") or []:
             message_data = event_data.get("message_create")
             message_data["target"]["recipient"] = recipient
             message_data["target"]["sender"] = author
@@ -121,7 +99,8 @@ class EventParser:
         try:
             self.client_id = int(self.http_client.access_token.partition("-")[0])
         except AttributeError:
-            self.client_id = int(self.http_client.fetch_me().id)
+            me = self.http_client.fetch_me()
+            self.client_id = me.id if me else None
 
     def parse_direct_message_create(self, direct_message_payload: Payload):
         event_payload = {"event": direct_message_payload.get("direct_message_events")[0]}
@@ -141,7 +120,7 @@ class EventParser:
         )
         application_info = direct_message_payload.get("apps")
         if application_info:
-            source_app_id = list(application_info.keys())[0]
+            source_app_id = next(iter(application_info))
             source_app = ApplicationInfo(**application_info.get(source_app_id))
 
         else:
@@ -280,13 +259,9 @@ class EventParser:
             message = Message(None, tweet_id, 1)
             return self.http_client.dispatch("tweet_delete", message)
 
-        try:
-            self.http_client.tweet_cache.pop(int(tweet_id))
-        except KeyError:
-            pass
-        finally:
-            tweet.deleted_timestamp = int(event_payload.get("timestamp_ms"))
-            self.http_client.dispatch("tweet_delete", tweet)
+        self.http_client.tweet_cache.pop(int(tweet_id), None)
+        tweet.deleted_timestamp = int(event_payload.get("timestamp_ms"))
+        self.http_client.dispatch("tweet_delete", tweet)
 
     def parse_favorite_tweet(self, favorite_payload: Payload):
         action_payload = favorite_payload.copy()
@@ -23,7 +23,7 @@ class Space(Comparable):
     .. versionadded:: 1.3.5
     """
 
-    __slots__ = ("__original_payload", "_payload", "http_client", "_include")
+    __slots__ = ("__original_payload", "_payload", "http_client", "_includes")
 
     def __init__(self, data: Dict[str, Any], http_client: object):
         self.__original_payload = data
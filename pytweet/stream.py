@@ -125,7 +125,7 @@ class StreamConnection:
                 for response_line in response.iter_lines():
                     if response_line:
                         json_data = json.loads(response_line.decode("UTF-8"))
-                        if "errors" in json_data.keys():
+                        if "errors" in json_data:
                             raise ConnectionException(self.session, None)
                         tweet = Tweet(json_data, http_client=http)
                         http.tweet_cache[tweet.id] = tweet
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import datetime
+from urllib.parse import urlencode
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+import msgspec
+
 from .attachments import Poll, Geo, File
 from .entities import Media
 from .enums import ReplySetting
-from .constants import TWEET_FIELD, USER_FIELD, PINNED_TWEET_EXPANSION
+from .constants import _USER_PARAMS
 from .metrics import TweetPublicMetrics
 from .relations import RelationHide, RelationLike, RelationRetweet, RelationDelete
 from .user import User
-from .utils import time_parse_todt
+from .utils import time_parse_todt, _from_timestamp_ms
 from .message import Message
 from .paginations import UserPagination
 
@@ -20,6 +23,9 @@ if TYPE_CHECKING:
 
 __all__ = ("EmbedsImages", "Embed", "Tweet")
 
+_MISSING = object()
+_USER_TWEET_QUERY = urlencode(_USER_PARAMS)
+
 
 class EmbedsImages:
     """Represents the tweets embed images.
@@ -27,13 +33,17 @@ class EmbedsImages:
     .. versionadded: 1.1.3
     """
 
-    __slots__ = "_payload"
+    __slots__ = ("_url", "_width", "_height")
 
     def __init__(self, data: Dict[str, Any]) -> None:
-        self._payload = data
+        width = data.get("width")
+        height = data.get("height")
+        self._url = data.get("url")
+        self._width = int(width) if width is not None else None
+        self._height = int(height) if height is not None else None
 
     def __repr__(self) -> str:
-        return "EmbedsImages(url={0.url} width={0.width} height={0.height})".format(self)
+        return f"EmbedsImages(url={self.url} width={self.width} height={self.height})"
 
     def __str__(self) -> str:
         return self.url
@@ -44,7 +54,7 @@ class EmbedsImages:
 
         .. versionadded: 1.1.3
         """
-        return int(self._payload.get("width"))
+        return self._width
 
     @property
     def height(self) -> int:
@@ -52,7 +62,7 @@ class EmbedsImages:
 
         .. versionadded: 1.1.3
         """
-        return int(self._payload.get("height"))
+        return self._height
 
     @property
     def url(self) -> str:
@@ -60,7 +70,7 @@ class EmbedsImages:
 
         .. versionadded: 1.1.3
         """
-        return self._payload.get("url")
+        return self._url
 
 
 class Embed:
@@ -69,13 +79,19 @@ class Embed:
     .. versionadded: 1.1.3
     """
 
-    __slots__ = "_payload"
+    __slots__ = ("_payload", "_start", "_end", "_status_code")
 
     def __init__(self, data: Dict[str, Any]):
+        start = data.get("start")
+        end = data.get("end")
+        status_code = data.get("status")
         self._payload = data
+        self._start = int(start) if start is not None else None
+        self._end = int(end) if end is not None else None
+        self._status_code = int(status_code) if status_code is not None else None
 
     def __repr__(self) -> str:
-        return "Embed(title={0.title} description={0.description} url={0.url})".format(self)
+        return f"Embed(title={self.title} description={self.description} url={self.url})"
 
     def __str__(self) -> str:
         return self.url
@@ -102,7 +118,7 @@ class Embed:
 
         .. versionadded: 1.1.3
         """
-        return int(self._payload.get("start"))
+        return self._start
 
     @property
     def end(self) -> int:
@@ -110,7 +126,7 @@ class Embed:
 
         .. versionadded: 1.1.3
         """
-        return int(self._payload.get("end"))
+        return self._end
 
     @property
     def url(self) -> str:
@@ -150,8 +166,9 @@ class Embed:
 
         .. versionadded:: 1.1.3
         """
-        if self._payload.get("images"):
-            return [EmbedsImages(data) for data in self._payload.get("images")]
+        images = self._payload.get("images")
+        if images:
+            return list(map(EmbedsImages, images))
 
         return None
 
@@ -161,7 +178,7 @@ class Embed:
 
         .. versionadded: 1.1.3
         """
-        return int(self._payload.get("status"))
+        return self._status_code
 
 
 class Tweet(Message):
@@ -190,7 +207,26 @@ class Tweet(Message):
         "__original_payload",
         "_payload",
         "_includes",
-        "tweet_metrics",
+        "_source",
+        "_lang",
+        "_raw_reply_setting",
+        "_possibly_sensitive",
+        "_conversation_id",
+        "_in_reply_to_user_id",
+        "_timestamp",
+        "_created_at",
+        "_created_at_cache",
+        "_urls",
+        "_users",
+        "_polls",
+        "_media",
+        "_mentions",
+        "_author_cache",
+        "_poll_cache",
+        "_media_cache",
+        "_embeds_cache",
+        "_mentions_cache",
+        "_tweet_metrics",
         "http_client",
         "deleted_timestamp",
     )
@@ -203,15 +239,50 @@ class Tweet(Message):
         http_client: Optional[HTTPClient] = None,
     ) -> None:
         self.__original_payload = data
-        self._payload = data.get("data") or data
-        self._includes = self.__original_payload.get("includes")
-        self.tweet_metrics = TweetPublicMetrics(self._payload)
+        payload = data.get("data")
+        if payload is None:
+            payload = data
+        self._payload = payload
+        self._includes = data.get("includes")
+
+        includes = self._includes or {}
+        self._source = payload.get("source")
+        self._lang = payload.get("lang")
+        self._raw_reply_setting = payload.get("reply_settings")
+        self._possibly_sensitive = payload.get("possibly_sensitive")
+        self._conversation_id = payload.get("conversation_id")
+        self._in_reply_to_user_id = payload.get("in_reply_to_user_id")
+        self._timestamp = payload.get("timestamp")
+        self._created_at = payload.get("created_at")
+        self._created_at_cache = None
+        self._urls = (payload.get("entities") or {}).get("urls")
+        self._users = includes.get("users")
+        self._polls = includes.get("polls")
+        self._media = includes.get("media")
+        self._mentions = includes.get("mentions")
+        self._author_cache = _MISSING
+        self._poll_cache = _MISSING
+        self._media_cache = _MISSING
+        self._embeds_cache = _MISSING
+        self._mentions_cache = _MISSING
+        self._tweet_metrics = None
         self.http_client = http_client
         self.deleted_timestamp = deleted_timestamp
-        super().__init__(self._payload.get("text"), self._payload.get("id"), 1)
+        super().__init__(payload.get("text"), payload.get("id"), 1)
 
     def __repr__(self) -> str:
-        return "Tweet(text={0.text} id={0.id} author={0.author!r})".format(self)
+        return f"Tweet(text={self.text} id={self.id} author={self.author!r})"
+
+    @property
+    def tweet_metrics(self) -> TweetPublicMetrics:
+        """:class:`TweetPublicMetrics`: Return the tweet's public metrics.
+
+        .. versionadded: 1.0.0
+        """
+        metrics = self._tweet_metrics
+        if metrics is None:
+            metrics = self._tweet_metrics = TweetPublicMetrics(self._payload)
+        return metrics
 
     @property
     def author(self) -> Optional[User]:
@@ -219,9 +290,10 @@ class Tweet(Message):
 
         .. versionadded: 1.0.0
         """
-        if self._includes and self._includes.get("users"):
-            return User(self._includes.get("users")[0], http_client=self.http_client)
-        return None
+        author = self._author_cache
+        if author is _MISSING:
+            author = self._author_cache = User(self._users[0], http_client=self.http_client) if self._users else None
+        return author
 
     @property
     def possibly_sensitive(self) -> bool:
@@ -229,7 +301,7 @@ class Tweet(Message):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("possibly_sensitive")
+        return bool(self._possibly_sensitive)
 
     @property
     def sensitive(self) -> bool:
@@ -245,9 +317,14 @@ class Tweet(Message):
 
         .. versionadded: 1.0.0
         """
-        if self._payload.get("timestamp", None):
-            return datetime.datetime.fromtimestamp(int(self._payload.get("timestamp", None)) / 1000)
-        return time_parse_todt(self._payload.get("created_at"))
+        created_at = self._created_at_cache
+        if created_at is None:
+            if self._timestamp:
+                created_at = _from_timestamp_ms(int(self._timestamp))
+            else:
+                created_at = time_parse_todt(self._created_at)
+            self._created_at_cache = created_at
+        return created_at
 
     @property
     def deleted_at(self) -> Optional[datetime.datetime]:
@@ -260,7 +337,7 @@ class Tweet(Message):
         """
         if not self.deleted_timestamp:
             return None
-        return datetime.datetime.fromtimestamp(self.deleted_timestamp / 1000)
+        return _from_timestamp_ms(int(self.deleted_timestamp))
 
     @property
     def source(self) -> str:
@@ -268,7 +345,7 @@ class Tweet(Message):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("source")
+        return self._source
 
     @property
     def raw_reply_setting(self) -> str:
@@ -276,7 +353,7 @@ class Tweet(Message):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("reply_settings")
+        return self._raw_reply_setting
 
     @property
     def reply_setting(self) -> ReplySetting:
@@ -284,7 +361,7 @@ class Tweet(Message):
 
         .. versionadded: 1.3.5
         """
-        return ReplySetting(self._payload.get("reply_settings"))
+        return ReplySetting(self._raw_reply_setting)
 
     @property
     def lang(self) -> str:
@@ -292,7 +369,7 @@ class Tweet(Message):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("lang")
+        return self._lang
 
     @property
     def conversation_id(self) -> Optional[int]:
@@ -300,10 +377,8 @@ class Tweet(Message):
 
         .. versionadded: 1.0.0
         """
-        try:
-            return int(self._payload.get("conversation_id"))
-        except ValueError:
-            return None
+        conversation_id = self._conversation_id
+        return int(conversation_id) if conversation_id is not None else None
 
     @property
     def url(self) -> Optional[str]:
@@ -314,10 +389,10 @@ class Tweet(Message):
         .. versionchanged:: 1.5.0
             Returns None if the author is invalid or the tweet doesn't have id.
         """
-        try:
-            return f"https://twitter.com/{self.author.username}/status/{self.id}"
-        except TypeError:
+        author = self.author
+        if author is None or self._id is None:
             return None
+        return f"https://twitter.com/{author.username}/status/{self.id}"
 
     @property
     def mentions(self) -> Optional[List[str]]:
@@ -325,9 +400,11 @@ class Tweet(Message):
 
         .. versionadded:: 1.1.3
         """
-        if self._includes and self._includes.get("mentions"):
-            return [user for user in self._includes.get("mentions")]
-        return None
+        mentions = self._mentions_cache
+        if mentions is _MISSING:
+            mentions = self._mentions
+            mentions = self._mentions_cache = list(mentions) if mentions else None
+        return mentions
 
     @property
     def poll(self) -> Optional[Poll]:
@@ -335,19 +412,26 @@ class Tweet(Message):
 
         .. versionadded:: 1.1.0
         """
-        if self._includes:
-            if self._includes.get("polls"):
-                data = self._includes.get("polls")[0]
-                poll = Poll(
-                    data.get("duration_minutes"),
-                    id=data.get("id"),
-                    voting_status=data.get("voting_status"),
-                    end_date=data.get("end_datetime"),
-                )
-                for option in data.get("options"):
-                    poll.add_option(**option)
-                return poll
-        return None
+        poll = self._poll_cache
+        if poll is not _MISSING:
+            return poll
+
+        poll = None
+        polls = self._polls
+        if polls:
+            data = polls[0]
+            poll = Poll(
+                duration=data.get("duration_minutes"),
+                id=data.get("id"),
+                voting_status=data.get("voting_status"),
+                end_date=data.get("end_datetime"),
+            )
+            add_option = poll.add_option
+            for option in data.get("options") or ():
+                add_option(**option)
+
+        self._poll_cache = poll
+        return poll
 
     @property
     def media(self) -> Optional[Media]:
@@ -355,9 +439,11 @@ class Tweet(Message):
 
         .. versionadded:: 1.1.0
         """
-        if self._includes and self._includes.get("media"):
-            return [Media(img) for img in self._includes.get("media")]
-        return None
+        media = self._media_cache
+        if media is _MISSING:
+            media = self._media
+            media = self._media_cache = msgspec.convert(media, List[Media], strict=False) if media else None
+        return media
 
     @property
     def embeds(self) -> Optional[List[Embed]]:
@@ -365,9 +451,11 @@ class Tweet(Message):
 
         .. versionadded:: 1.1.3
         """
-        if self._payload.get("entities") and self._payload.get("entities").get("urls"):
-            return [Embed(url) for url in self._payload.get("entities").get("urls")]
-        return None
+        embeds = self._embeds_cache
+        if embeds is _MISSING:
+            urls = self._urls
+            embeds = self._embeds_cache = list(map(Embed, urls)) if urls else None
+        return embeds
 
     @property
     def like_count(self) -> int:
@@ -412,7 +500,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
 
         payload = {"tweet_id": str(self.id)}
         res = self.http_client.request("POST", "2", f"/users/{my_id}/likes", json=payload, auth=True)
@@ -430,9 +518,9 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
 
-        res = self.http_client.request("DELETE", "2", f"/users/{my_id}/likes/{self.id}", auth=True)
+        res = self.http_client.request("DELETE", "2", f"/users/{my_id}/likes/{self._id}", auth=True)
 
         return RelationLike(res)
 
@@ -447,7 +535,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         res = self.http_client.request(
             "POST",
             "2",
@@ -469,9 +557,9 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
 
-        res = self.http_client.request("DELETE", "2", f"/users/{my_id}/retweets/{self.id}", auth=True)
+        res = self.http_client.request("DELETE", "2", f"/users/{my_id}/retweets/{self._id}", auth=True)
 
         return RelationRetweet(res)
 
@@ -483,12 +571,9 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.0
         """
-        res = self.http_client.request("DELETE", "2", f"/tweets/{self.id}", auth=True)
+        res = self.http_client.request("DELETE", "2", f"/tweets/{self._id}", auth=True)
 
-        try:
-            self.http_client.tweet_cache.pop(self.id)
-        except KeyError:
-            pass
+        self.http_client.tweet_cache.pop(self.id, None)
 
         return RelationDelete(res)
 
@@ -548,6 +633,10 @@ class Tweet(Message):
             media_tagged_users=media_tagged_users,
         )
 
+    def _set_hidden(self, hidden: bool) -> RelationHide:
+        res = self.http_client.request("PUT", "2", f"/tweets/{self._id}/hidden", json={"hidden": hidden}, auth=True)
+        return RelationHide(res)
+
     def hide(self) -> RelationHide:
         """Hide a reply tweet.
 
@@ -559,8 +648,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.5
         """
-        res = self.http_client.request("PUT", "2", f"/tweets/{self.id}/hidden", json={"hidden": False}, auth=True)
-        return RelationHide(res)
+        return self._set_hidden(True)
 
     def unhide(self) -> RelationHide:
         """Unhide a hide reply.
@@ -573,8 +661,7 @@ class Tweet(Message):
 
         .. versionadded:: 1.2.5
         """
-        res = self.http_client.request("PUT", "2", f"/tweets/{self.id}/hidden", json={"hidden": False}, auth=True)
-        return RelationHide(res)
+        return self._set_hidden(False)
 
     def fetch_retweeters(self) -> Optional[UserPagination]:
         """Return users that retweeted the tweet.
@@ -587,28 +674,21 @@ class Tweet(Message):
 
         .. versionadded:: 1.1.3
         """
+        path = f"/tweets/{self._id}/retweeted_by"
         res = self.http_client.request(
             "GET",
             "2",
-            f"/tweets/{self.id}/retweeted_by",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            path,
+            params=_USER_TWEET_QUERY,
         )
         if not res:
-            return []
+            return UserPagination.empty()
 
         return UserPagination(
             res,
-            endpoint_request=f"/tweets/{self.id}/retweeted_by",
+            endpoint_request=path,
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=_USER_PARAMS.copy(),
         )
 
     def fetch_likers(self) -> Optional[UserPagination]:
@@ -622,29 +702,22 @@ class Tweet(Message):
 
         .. versionadded:: 1.1.3
         """
+        path = f"/tweets/{self._id}/liking_users"
         res = self.http_client.request(
             "GET",
             "2",
-            f"/tweets/{self.id}/liking_users",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            path,
+            params=_USER_TWEET_QUERY,
         )
 
         if not res:
-            return []
+            return UserPagination.empty()
 
         return UserPagination(
             res,
-            endpoint_request=f"/tweets/{self.id}/liking_users",
+            endpoint_request=path,
             http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=_USER_PARAMS.copy(),
         )
 
     def fetch_replied_user(self) -> Optional[User]:
@@ -660,9 +733,9 @@ class Tweet(Message):
         """
         return (
             self.http_client.fetch_user(
-                int(self._payload.get("in_reply_to_user_id")),
+                int(self._in_reply_to_user_id),
                 http_client=self.http_client,
             )
-            if self._payload.get("in_reply_to_user_id")
+            if self._in_reply_to_user_id
             else None
         )
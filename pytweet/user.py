@@ -2,34 +2,32 @@ from __future__ import annotations
 
 import io
 import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union, List
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union, List
 
 from .constants import (
-    TWEET_EXPANSION,
-    LIST_EXPANSION,
     PINNED_TWEET_EXPANSION,
-    MEDIA_FIELD,
-    PLACE_FIELD,
-    POLL_FIELD,
-    TWEET_FIELD,
-    USER_FIELD,
-    LIST_FIELD,
+    _USER_PARAMS,
+    _TWEET_PARAMS,
+    _LIST_PARAMS,
 )
 from .metrics import UserPublicMetrics
 from .relations import RelationFollow
-from .utils import time_parse_todt
+from .utils import time_parse_todt, _from_timestamp_ms
 from .dataclass import UserSettings, Location
 from .paginations import UserPagination, TweetPagination, ListPagination
 from .list import List as TwitterList
 from .objects import Comparable
+from .enums import Timezone
+from .attachments import Geo
 
 if TYPE_CHECKING:
     from .message import DirectMessage
     from .http import HTTPClient
     from .type import ID
     from .tweet import Tweet
-    from .enums import Timezone
-    from .attachments import Geo, CTA, CustomProfile, File, QuickReply
+    from .attachments import CTA, CustomProfile, File, QuickReply
+
+_MISSING = object()
 
 
 class User(Comparable):
@@ -56,20 +54,42 @@ class User(Comparable):
     """
 
     __slots__ = (
-        "__original_payload",
         "_includes",
         "_payload",
+        "_id",
+        "_name",
+        "_username",
+        "_description",
+        "_url",
+        "_profile_image_url",
+        "_verified",
+        "_protected",
+        "_location",
+        "_created_at",
         "http_client",
         "_metrics",
+        "_pinned_tweet_cache",
     )
 
     def __init__(self, data: Dict[str, Any], http_client: Optional[HTTPClient] = None) -> None:
-        self.__original_payload = data
-        self._includes = self.__original_payload.get("includes")
-        self._payload = self.__original_payload.get("data") or self.__original_payload
+        self._includes = data.get("includes")
+        self._payload = data.get("data") or data
+
+        payload = self._payload
+        self._id = int(payload.get("id"))
+        self._name = payload.get("name")
+        self._username = payload.get("username")
+        self._description = payload.get("description")
+        self._url = payload.get("url")
+        self._profile_image_url = payload.get("profile_image_url")
+        self._verified = payload.get("verified")
+        self._protected = payload.get("protected")
+        self._location = payload.get("location")
+        self._created_at = None
         self.http_client = http_client
-        self._metrics = UserPublicMetrics(self._payload) or self.__original_payload
-        super().__init__(self.id)
+        self._metrics = None
+        self._pinned_tweet_cache = _MISSING
+        super().__init__(self._id)
 
     def __str__(self) -> str:
         return self.username
@@ -83,7 +103,7 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("name")
+        return self._name
 
     @property
     def username(self) -> str:
@@ -91,7 +111,7 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("username")
+        return self._username
 
     @property
     def id(self) -> int:
@@ -99,7 +119,7 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return int(self._payload.get("id"))
+        return self._id
 
     @property
     def description(self) -> str:
@@ -107,7 +127,7 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("description")
+        return self._description
 
     @property
     def bio(self) -> str:
@@ -131,15 +151,20 @@ class User(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        from .tweet import Tweet  # Avoid circular import error.
+        pinned_tweet = self._pinned_tweet_cache
+        if pinned_tweet is _MISSING:
+            tweets = self._includes.get("tweets") if self._includes else None
+            if tweets:
+                from .tweet import Tweet  # Avoid circular import error.
 
-        if self._includes and self._includes.get("tweets"):
-            data = {}
-            data["data"] = self._includes.get("tweets")[0]
-            data["includes"] = {}
-            data["includes"]["users"] = [self.__original_payload]
-            return Tweet(data, http_client=self.http_client)
-        return None
+                pinned_tweet = Tweet(
+                    {"data": tweets[0], "includes": {"users": [self._payload]}},
+                    http_client=self.http_client,
+                )
+            else:
+                pinned_tweet = None
+            self._pinned_tweet_cache = pinned_tweet
+        return pinned_tweet
 
     @property
     def url(self) -> Optional[str]:
@@ -147,7 +172,7 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("url", None)
+        return self._url
 
     @property
     def profile_url(self) -> str:
@@ -163,7 +188,7 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("profile_image_url", None)
+        return self._profile_image_url
 
     @property
     def verified(self) -> bool:
@@ -171,7 +196,7 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("verified")
+        return self._verified
 
     @property
     def protected(self) -> bool:
@@ -179,7 +204,7 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("protected")
+        return self._protected
 
     @property
     def private(self) -> bool:
@@ -195,17 +220,25 @@ class User(Comparable):
 
         .. versionadded: 1.0.0
         """
-        return self._payload.get("location", None)
+        return self._location
 
     @property
-    def created_at(self) -> datetime.datetime:
+    def created_at(self) -> Optional[datetime.datetime]:
         """Optional[:class:`datetime.datetime`]: Returns a datetime.datetime object with the user's account date.
 
         .. versionadded: 1.0.0
         """
-        if isinstance(self._payload.get("created_at"), str):
-            return datetime.datetime.fromtimestamp(int(self._payload.get("created_at")) / 1000)
-        return time_parse_todt(self._payload.get("created_at"))
+        created_at = self._created_at
+        if created_at is None:
+            raw = self._payload.get("created_at")
+            if not raw:
+                return None
+            if not isinstance(raw, str) or raw.isdigit():
+                created_at = _from_timestamp_ms(int(raw))
+            else:
+                created_at = time_parse_todt(raw)
+            self._created_at = created_at
+        return created_at
 
     @property
     def follower_count(self) -> int:
@@ -213,7 +246,7 @@ class User(Comparable):
 
         .. versionadded: 1.1.0
         """
-        return self._metrics.follower_count
+        return self._get_metrics().follower_count
 
     @property
     def following_count(self) -> int:
@@ -221,7 +254,7 @@ class User(Comparable):
 
         .. versionadded: 1.1.0
         """
-        return self._metrics.following_count
+        return self._get_metrics().following_count
 
     @property
     def tweet_count(self) -> int:
@@ -229,7 +262,7 @@ class User(Comparable):
 
         .. versionadded: 1.1.0
         """
-        return self._metrics.tweet_count
+        return self._get_metrics().tweet_count
 
     @property
     def listed_count(self) -> int:
@@ -237,7 +270,13 @@ class User(Comparable):
 
         .. versionadded: 1.1.0
         """
-        return self._metrics.listed_count
+        return self._get_metrics().listed_count
+
+    def _get_metrics(self) -> UserPublicMetrics:
+        metrics = self._metrics
+        if metrics is None:
+            metrics = self._metrics = UserPublicMetrics(self._payload)
+        return metrics
 
     def send(
         self,
@@ -291,7 +330,7 @@ class User(Comparable):
 
         .. versionadded:: 1.1.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         res = self.http_client.request(
             "POST",
             "2",
@@ -312,7 +351,7 @@ class User(Comparable):
 
         .. versionadded:: 1.1.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         res = self.http_client.request("DELETE", "2", f"/users/{my_id}/following/{self.id}", auth=True)
         return RelationFollow(res)
 
@@ -321,7 +360,7 @@ class User(Comparable):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         self.http_client.request(
             "POST",
             "2",
@@ -335,7 +374,7 @@ class User(Comparable):
 
         .. versionadded:: 1.2.0
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         self.http_client.request("DELETE", "2", f"/users/{my_id}/blocking/{self.id}", auth=True)
 
     def mute(self) -> None:
@@ -343,7 +382,7 @@ class User(Comparable):
 
         .. versionadded:: 1.2.5
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         self.http_client.request(
             "POST",
             "2",
@@ -357,7 +396,7 @@ class User(Comparable):
 
         .. versionadded:: 1.2.5
         """
-        my_id = self.http_client.access_token.partition("-")[0]
+        my_id = self.http_client.my_id
         self.http_client.request("DELETE", "2", f"/users/{my_id}/muting/{self.id}", auth=True)
 
     def report(self, *, block: bool = True):
@@ -391,6 +430,22 @@ class User(Comparable):
             auth=True,
         )
 
+    def _fetch_pagination(
+        self, suffix: str, pagination: type, params: Dict[str, str], *, auth: bool = False
+    ) -> Union[UserPagination, TweetPagination, ListPagination]:
+        endpoint = f"/users/{self._id}{suffix}"
+        res = self.http_client.request("GET", "2", endpoint, params=params, auth=auth)
+
+        if not res:
+            return pagination.empty()
+
+        return pagination(
+            res,
+            endpoint_request=endpoint,
+            http_client=self.http_client,
+            params=params.copy(),
+        )
+
     def fetch_followers(self) -> Optional[UserPagination]:
         """Fetches users from the user's followers list then paginate it .
 
@@ -402,30 +457,7 @@ class User(Comparable):
 
         .. versionadded:: 1.3.5
         """
-        following = self.http_client.request(
-            "GET",
-            "2",
-            f"/users/{self.id}/followers",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-        )
-
-        if not following:
-            return []
-
-        return UserPagination(
-            following,
-            endpoint_request=f"/users/{self.id}/followers",
-            http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-        )
+        return self._fetch_pagination("/followers", UserPagination, _USER_PARAMS)
 
     def fetch_following(self) -> Optional[UserPagination]:
         """Fetches users from the user's following list then paginate it.
@@ -438,30 +470,7 @@ class User(Comparable):
 
         .. versionadded:: 1.3.5
         """
-        following = self.http_client.request(
-            "GET",
-            "2",
-            f"/users/{self.id}/following",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-        )
-
-        if not following:
-            return []
-
-        return UserPagination(
-            following,
-            endpoint_request=f"/users/{self.id}/following",
-            http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-        )
+        return self._fetch_pagination("/following", UserPagination, _USER_PARAMS)
 
     def fetch_blockers(self) -> Optional[UserPagination]:
         """Fetches users from the user's block list then paginate it.
@@ -474,31 +483,7 @@ class User(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        blockers = self.http_client.request(
-            "GET",
-            "2",
-            f"/users/{self.id}/blocking",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-            auth=True,
-        )
-
-        if not blockers:
-            return []
-
-        return UserPagination(
-            blockers,
-            endpoint_request=f"/users/{self.id}/blocking",
-            http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-        )
+        return self._fetch_pagination("/blocking", UserPagination, _USER_PARAMS, auth=True)
 
     def fetch_muters(self) -> Optional[UserPagination]:
         """Fetches users from the user's mute list then paginate it.
@@ -511,31 +496,7 @@ class User(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        muters = self.http_client.request(
-            "GET",
-            "2",
-            f"/users/{self.id}/muting",
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-            auth=True,
-        )
-
-        if not muters:
-            return []
-
-        return UserPagination(
-            muters,
-            endpoint_request=f"/users/{self.id}/muting",
-            http_client=self.http_client,
-            params={
-                "expansions": PINNED_TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
-        )
+        return self._fetch_pagination("/muting", UserPagination, _USER_PARAMS, auth=True)
 
     def fetch_timelines(
         self,
@@ -546,7 +507,7 @@ class User(Comparable):
         until_id: Optional[ID] = None,
         mentioned: bool = False,
         exclude: Optional[str] = None,
-    ) -> Union[TweetPagination, list]:
+    ) -> TweetPagination:
         """Fetches the user timelines, this can be timelines where the user got mention or a normal tweet timelines.
 
         Parameters
@@ -566,33 +527,19 @@ class User(Comparable):
 
         Returns
         ---------
-        Union[:class:`TweetPagination`, :class:`list`]
-            This method returns a :class:`TweetPagination` objects or an empty :class:`list` if none founded.
+        :class:`TweetPagination`
+            This method returns a :class:`TweetPagination` object, which is empty if none founded.
 
 
         .. versionadded:: 1.3.5
         """
-        if (
-            not isinstance(start_time, datetime.datetime)
-            and start_time
-            or not isinstance(end_time, datetime.datetime)
-            and end_time
-        ):
-            raise ValueError("start_time or end_time must be a datetime object!")
-
-        params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "media.fields": MEDIA_FIELD,
-            "place.fields": PLACE_FIELD,
-            "poll.fields": POLL_FIELD,
-            "tweet.fields": TWEET_FIELD,
-        }
-
-        if start_time:
-            params["start_time"] = start_time.isoformat()
-        if end_time:
-            params["end_time"] = end_time.isoformat()
+        params = _TWEET_PARAMS.copy()
+        for key, value in (("start_time", start_time), ("end_time", end_time)):
+            if value is None:
+                continue
+            if not isinstance(value, datetime.datetime):
+                raise ValueError(f"{key} must be a datetime object!")
+            params[key] = value.isoformat()
         if since_id:
             params["since_id"] = str(since_id)
         if until_id:
@@ -600,51 +547,14 @@ class User(Comparable):
         if exclude:
             params["exclude"] = exclude
 
-        res = self.http_client.request(
-            "GET",
-            "2",
-            f"/users/{self.id}/tweets" if not mentioned else f"/users/{self.id}/mentions",
-            params=params,
-        )
-
-        if not res:
-            return []
-        return TweetPagination(
-            res,
-            endpoint_request=f"/users/{self.id}/tweets" if not mentioned else f"/users/{self.id}",
-            http_client=self.http_client,
-            params=params,
-        )
+        return self._fetch_pagination("/mentions" if mentioned else "/tweets", TweetPagination, params)
 
     def fetch_liked_tweets(self) -> TweetPagination:
         """Fetches tweets that's been liked by the user.
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": TWEET_EXPANSION,
-            "user.fields": USER_FIELD,
-            "media.fields": MEDIA_FIELD,
-            "place.fields": PLACE_FIELD,
-            "poll.fields": POLL_FIELD,
-            "tweet.fields": TWEET_FIELD,
-        }
-
-        res = self.http_client.request(
-            "GET",
-            "2",
-            f"/users/{self.id}/liked_tweets",
-            params=params,
-        )
-
-        if not res:
-            return []
-        return TweetPagination(
-            res,
-            endpoint_request=f"/users/{self.id}/liked_tweets",
-            http_client=self.http_client,
-            params=params,
-        )
+        return self._fetch_pagination("/liked_tweets", TweetPagination, _TWEET_PARAMS)
 
     def fetch_pinned_tweet(self) -> Optional[Tweet]:
         """Fetches the user's pinned tweet, consider using this method if :meth:`User.pinned_tweet` returns None.
@@ -658,36 +568,20 @@ class User(Comparable):
         .. versionadded: 1.1.3
         """
         id = self._payload.get(PINNED_TWEET_EXPANSION)
-        return self.http_client.fetch_tweet(int(id)) if id else None
+        return self.http_client.fetch_tweet(id) if id else None
 
-    def fetch_lists(self) -> Optional[List[TwitterList]]:
+    def fetch_lists(self) -> ListPagination:
         """Fetches the user's lists
 
         Returns
         ---------
-        Optional[List[:class:`List`]]
-            This method returns a list of :class:`List` objects.
+        :class:`ListPagination`
+            This method returns a :class:`ListPagination` object.
 
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": LIST_EXPANSION,
-            "list.fields": LIST_FIELD,
-            "user.fields": USER_FIELD,
-        }
-
-        res = self.http_client.request("GET", "2", f"/users/{self.id}/owned_lists", params=params)
-
-        if not res:
-            return []
-
-        return ListPagination(
-            res,
-            endpoint_request=f"/users/{self.id}/owned_lists",
-            http_client=self.http_client,
-            params=params,
-        )
+        return self._fetch_pagination("/owned_lists", ListPagination, _LIST_PARAMS)
 
     def fetch_pinned_lists(self) -> Optional[List[TwitterList]]:
         """Fetches the user's pinned lists, returns an empty list if not found
@@ -705,72 +599,36 @@ class User(Comparable):
             "2",
             f"/users/{self.id}/pinned_lists",
             auth=True,
-            params={
-                "expansions": LIST_EXPANSION,
-                "user.fields": USER_FIELD,
-                "list.fields": LIST_FIELD,
-            },
+            params=_LIST_PARAMS,
         )
         if not res:
             return None
 
-        for data in res["data"]:
-            self.http_client.payload_parser.insert_list_owner(data, self)
+        owner = [self._payload]
+        return [
+            TwitterList({**data, "includes": {"users": owner}}, http_client=self.http_client) for data in res["data"]
+        ]
 
-        return [TwitterList(data, http_client=self.http_client) for data in res["data"]]
-
-    def fetch_list_memberships(self) -> Union[ListPagination, List]:
+    def fetch_list_memberships(self) -> ListPagination:
         """Fetches all :class:`List`s the user is a member of.
 
         Returns
         ---------
-        Optional[List[:class:`List`]]
-            This method returns a list of :class:`List` objects.
+        :class:`ListPagination`
+            This method returns a :class:`ListPagination` object.
 
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": LIST_EXPANSION,
-            "list.fields": LIST_FIELD,
-            "user.fields": USER_FIELD,
-        }
+        return self._fetch_pagination("/list_memberships", ListPagination, _LIST_PARAMS)
 
-        res = self.http_client.request("GET", "2", f"/users/{self.id}/list_memberships", params=params)
-
-        if not res:
-            return []
-
-        return ListPagination(
-            res,
-            endpoint_request=f"/users/{self.id}/list_memberships",
-            http_client=self.http_client,
-            params=params,
-        )
-
-    def fetch_followed_lists(self) -> Union[ListPagination, List]:
+    def fetch_followed_lists(self) -> ListPagination:
         """Fetches the user's followed lists.
 
 
         .. versionadded:: 1.5.0
         """
-        params = {
-            "expansions": LIST_EXPANSION,
-            "list.fields": LIST_FIELD,
-            "user.fields": USER_FIELD,
-        }
-
-        res = self.http_client.request("GET", "2", f"/users/{self.id}/followed_lists", params=params)
-
-        if not res:
-            return []
-
-        return ListPagination(
-            res,
-            endpoint_request=f"/users/{self.id}/followed_lists",
-            http_client=self.http_client,
-            params=params,
-        )
+        return self._fetch_pagination("/followed_lists", ListPagination, _LIST_PARAMS)
 
 
 class ClientAccount(User):
@@ -823,16 +681,7 @@ class ClientAccount(User):
             },
             auth=True,
         )
-        if res.get("sleep_time"):
-            self.http_client.payload_parser.parse_sleep_time_payload(res)
-
-        if res.get("location"):
-            self.http_client.payload_parser.parse_trend_location_payload(res)
-
-        if res.get("time_zone"):
-            self.http_client.payload_parser.parse_time_zone_payload(res)
-
-        return UserSettings(**res)
+        return UserSettings.from_payload(res)
 
     def fetch_settings(self):
         """Fetches the user settings.
@@ -841,16 +690,7 @@ class ClientAccount(User):
         .. versionadded:: 1.5.0
         """
         res = self.http_client.request("GET", "1.1", "/account/settings.json", auth=True)
-        if res.get("sleep_time"):
-            self.http_client.payload_parser.parse_sleep_time_payload(res)
-
-        if res.get("location"):
-            self.http_client.payload_parser.parse_trend_location_payload(res)
-
-        if res.get("time_zone"):
-            self.http_client.payload_parser.parse_time_zone_payload(res)
-
-        return UserSettings(**res)
+        return UserSettings.from_payload(res)
 
     def update_profile(
         self,
@@ -882,34 +722,34 @@ class ClientAccount(User):
         Returns
         ---------
         :class:`ClientAccount`
-            Returns a updated client's account object.
+            Returns a updated client's account object. If only ``image`` was given, the current object is returned.
 
 
         .. versionadded:: 1.5.0
         """
+        http_client = self.http_client
         if image:
             path = image.path
-            if isinstance(path, io.IOBase):
-                self.http_client.request(
+            open_file = path if isinstance(path, io.IOBase) else open(path, "rb")
+            try:
+                http_client.request(
                     "POST",
                     "1.1",
                     "/account/update_profile_image.json",
-                    files={"image": path.read(4 * 1024 * 1024)},
-                    auth=True,
-                )
-            else:
-                self.http_client.request(
-                    "POST",
-                    "1.1",
-                    "/account/update_profile_image.json",
-                    files={"image": open(path, "rb").read(4 * 1024 * 1024)},
+                    files={"image": open_file},
                     auth=True,
                 )
+            finally:
+                if open_file is not path:
+                    open_file.close()
+
+        if all(arg is None for arg in (name, description, location, profile_url, profile_link_color)):
+            return self
 
         if isinstance(profile_link_color, int):
             profile_link_color = hex(profile_link_color).replace("0x", "", 1)
 
-        res = self.http_client.request(
+        res = http_client.request(
             "POST",
             "1.1",
             "/account/update_profile.json",
@@ -922,10 +762,8 @@ class ClientAccount(User):
             },
             auth=True,
         )
-        data = self.http_client.payload_parser.parse_user_payload(res)
-        updated_account = ClientAccount(data, http_client=self.http_client)
-        self = updated_account
-        return self
+        data = http_client.payload_parser.parse_user_payload(res)
+        return ClientAccount(data, http_client=http_client)
 
     def update_profile_banner(
         self,
@@ -955,8 +793,8 @@ class ClientAccount(User):
         .. versionadded:: 1.5.0
         """
         path = banner.path
-
-        if isinstance(path, io.IOBase):
+        open_file = path if isinstance(path, io.IOBase) else open(path, "rb")
+        try:
             self.http_client.request(
                 "POST",
                 "1.1",
@@ -967,23 +805,12 @@ class ClientAccount(User):
                     "offset_left": offset_left,
                     "offset_top": offset_top,
                 },
-                files={"banner": path.read(4 * 1024 * 1024)},
-                auth=True,
-            )
-        else:
-            self.http_client.request(
-                "POST",
-                "1.1",
-                "/account/update_profile_banner.json",
-                params={
-                    "width": width,
-                    "height": height,
-                    "offset_left": offset_left,
-                    "offset_top": offset_top,
-                },
-                files={"banner": open(path, "rb").read(4 * 1024 * 1024)},
+                files={"banner": open_file},
                 auth=True,
             )
+        finally:
+            if open_file is not path:
+                open_file.close()
         return None
 
     def remove_profile_banner(self):
@@ -994,17 +821,27 @@ class ClientAccount(User):
         """
         self.http_client.request("POST", "1.1", "/account/remove_profile_banner.json", auth=True)
 
-    def fetch_message_history(self):
+    def fetch_message_history(self) -> Iterator[DirectMessage]:
         """Returns all Direct Messages (both sent and received) within the last 30 days. Sorted in chronological order.
 
+        Returns
+        ---------
+        Iterator[:class:`DirectMessage`]
+            A one-shot iterator that builds each :class:`DirectMessage` as it is consumed. The request itself is made immediately.
+
 
         .. versionadded:: 1.5.0
+
+        .. versionchanged:: 1.5.0
+            Returns an iterator instead of a list. Wrap it in ``list()`` to use ``len()``, indexing, or to iterate it more than once.
         """
         # TODO return a pagination object.
         from .message import DirectMessage  # Avoid circular import error.
 
-        res = self.http_client.request("GET", "1.1", "/direct_messages/events/list.json", auth=True)
+        http_client = self.http_client
+        res = http_client.request("GET", "1.1", "/direct_messages/events/list.json", auth=True)
 
-        updated_res = self.http_client.payload_parser.parse_message_to_pagination_data(res, None, self)
+        updated_res = http_client.payload_parser.parse_message_to_pagination_data(res, None, self)
+        events = updated_res.get("events") or []
 
-        return [DirectMessage(data, http_client=self.http_client) for data in updated_res.get("events")]
+        return (DirectMessage(data, http_client=http_client) for data in events)
@@ -1,13 +1,30 @@
 from __future__ import annotations
 
 import datetime
-from typing import Any, Optional, Iterable, TYPE_CHECKING
+from functools import lru_cache
+from operator import attrgetter, methodcaller
+from typing import Any, Callable, Optional, Iterable, Tuple, TYPE_CHECKING
+from urllib.parse import quote, urlencode
 from dateutil import parser
 
 if TYPE_CHECKING:
     from .type import ID
 
+# Twitter's v2 ISO-8601 timestamps (for Pythons whose fromisoformat rejects "Z") and the v1.1 format.
+_TIME_FORMATS = ("%Y-%m-%dT%H:%M:%S.%fZ", "%a %b %d %H:%M:%S %z %Y")
+_USER_ACTIONS = frozenset(("follow", "dm"))
+_TWEET_ACTION_URLS = {
+    "retweet": "https://twitter.com/intent/retweet?tweet_id={}",
+    "like": "https://twitter.com/intent/like?tweet_id={}",
+    "reply": "https://twitter.com/intent/tweet?in_reply_to={}",
+}
 
+
+def _from_timestamp_ms(timestamp: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp // 1000).replace(microsecond=timestamp % 1000 * 1000)
+
+
+@lru_cache(maxsize=4096)
 def time_parse_todt(date: Optional[Any]) -> datetime.datetime:
     """Parse time return from twitter to datetime object!
 
@@ -18,20 +35,22 @@ def time_parse_todt(date: Optional[Any]) -> datetime.datetime:
 
     .. versionadded: 1.1.3
     """
-    date = str(parser.parse(date))
-    y, mo, d = date.split("-")
-    h, mi, s = date.split(" ")[1].split("+")[0].split(":")
-
-    return datetime.datetime(
-        year=int(y),
-        month=int(mo),
-        day=int(d.split(" ")[0]),
-        hour=int(h),
-        minute=int(mi),
-        second=int(s),
-    )
-
-
+    try:
+        parsed = datetime.datetime.fromisoformat(date)
+    except ValueError:
+        for fmt in _TIME_FORMATS:
+            try:
+                parsed = datetime.datetime.strptime(date, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            parsed = parser.parse(date)
+
+    return parsed.replace(tzinfo=None)
+
+
+@lru_cache(maxsize=1024)
 def compose_tweet(text: Optional[str] = None) -> str:
     """Make a link that let's you compose a tweet
 
@@ -49,16 +68,11 @@ def compose_tweet(text: Optional[str] = None) -> str:
     .. versionadded: 1.3.5
     """
     if text:
-        text = text.replace(" ", "%20")
-    return (
-        "https://twitter.com/intent/tweet"
-        if not text
-        else f"https://twitter.com/intent/tweet" + f"?text={text}"
-        if text
-        else f"https://twitter.com/intent/tweet"
-    )
+        return f"https://twitter.com/intent/tweet?text={quote(text, safe='')}"
+    return "https://twitter.com/intent/tweet"
 
 
+@lru_cache(maxsize=1024)
 def compose_user_action(user_id: str, action: str, text: str = None):
     """Make a link that let's you interact with a user with certain actions.
 
@@ -79,17 +93,16 @@ def compose_user_action(user_id: str, action: str, text: str = None):
 
     .. versionadded: 1.3.5
     """
-    if action.lower() not in ("follow", "dm"):
-        return TypeError("Action must be either 'follow' or 'dm'")
+    action = action.lower() if action else ""
+    if action not in _USER_ACTIONS:
+        raise TypeError("Action must be either 'follow' or 'dm'")
+    if action == "follow":
+        return f"https://twitter.com/intent/user?{urlencode({'user_id': user_id})}"
+
+    query = {"recipient_id": user_id}
     if text:
-        text = text.replace(" ", "%20")
-    return (
-        f"https://twitter.com/intent/user?user_id={user_id}"
-        if action.lower() == "follow"
-        else f"https://twitter.com/messages/compose?recipient_id={user_id}" + f"?text={text}"
-        if text
-        else f"https://twitter.com/messages/compose?recipient_id={user_id}"
-    )
+        query["text"] = text
+    return f"https://twitter.com/messages/compose?{urlencode(query, quote_via=quote)}"
 
 
 def compose_tweet_action(tweet_id: ID, action: str = None):
@@ -109,31 +122,46 @@ def compose_tweet_action(tweet_id: ID, action: str = None):
 
     .. versionadded: 1.3.5
     """
-    if action.lower() not in ("retweet", "like", "reply"):
-        return TypeError("Action must be either 'retweet', 'like', or 'reply'")
-    return (
-        f"https://twitter.com/intent/{action}?tweet_id={tweet_id}"
-        if action != "reply"
-        else f"https://twitter.com/intent/tweet?in_reply_to={tweet_id}"
+    url = _TWEET_ACTION_URLS.get(action.lower()) if action else None
+    if url is None:
+        raise TypeError("Action must be either 'retweet', 'like', or 'reply'")
+    return url.format(tweet_id)
+
+
+@lru_cache(maxsize=64)
+def _sift_getters(names: Tuple[str, ...]) -> Tuple[Callable[[Any], Any], ...]:
+    return tuple(
+        methodcaller(name[1:]) if name.startswith("_") and not name.startswith("__") else attrgetter(name)
+        for name in names
     )
 
 
-def sift(iterable: Iterable, **conditions: Any):
-    results = []
-    for item in iterable:
-        for condition, value in conditions.items():
-            real_condition = condition.replace("_", "", 1)
-            if condition.startswith("_") and not condition.startswith("__"):
-                result = getattr(item, real_condition, None)
-                if result:
-                    result = result()
-            else:
-                result = getattr(item, condition, None)
+def sift(iterable: Iterable, **conditions: Any) -> list:
+    """Filter the objects in an iterable that match every given condition.
+
+    Each keyword is an attribute name compared with ``==`` against its value. Prefix the name with a single underscore to call a method of that name instead, e.g. ``_upper="A"`` compares ``item.upper()``.
+
+    Parameters
+    ------------
+    iterable: :class:`Iterable`
+        The objects to filter.
+    **conditions: Any
+        The attribute names and the values they must equal.
+
+    Returns
+    ---------
+    :class:`list`
+        The matching objects in their original order. An empty list is returned when no condition is given.
+
 
-            if not result:
-                raise AttributeError(f"'{item.__class__.__name__}' object has no attribute '{real_condition}'")
+    .. versionadded:: 1.5.0
+    """
+    if not conditions:
+        return []
 
-            if result == value:
-                results.append(result)
+    checks = tuple(zip(_sift_getters(tuple(conditions)), conditions.values()))
+    if len(checks) == 1:
+        ((getter, value),) = checks
+        return [item for item in iterable if getter(item) == value]
 
-    return results
+    return [item for item in iterable if all(getter(item) == value for getter, value in checks)]
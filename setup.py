@@ -27,7 +27,6 @@ extras_require = {
 
 classifiers = [
     "License :: OSI Approved :: MIT License",
-    "Programming Language :: Python :: 3.7",
     "Programming Language :: Python :: 3.8",
     "Programming Language :: Python :: 3.9",
     "Programming Language :: Python :: 3.10",
@@ -60,6 +59,6 @@ setup(
     install_requires=requirements,
     extras_require=extras_require,
     keywords="PyTweet, pytweet, twitter, tweet.py twitter.py",
-    python_requires=">=3.7.0",
+    python_requires=">=3.8.0",
     classifiers=classifiers,
 )